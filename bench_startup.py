@@ -0,0 +1,79 @@
+"""Cold-start budget check for the menu path.
+
+Measures how much main's cumulative import time (python -X importtime) adds on top of
+pygame's own, and the time from just before `import main` in a fresh interpreter to the
+first menu frame (interpreter startup itself is not counted). Also checks that no
+gameplay module was loaded to get there. Runs headless; exits non-zero when a budget
+is exceeded:
+
+    python bench_startup.py
+"""
+import os
+import subprocess
+import sys
+
+# main's import time beyond pygame's, which dominates and varies a lot between machines.
+# Lazy main adds about 5 ms; importing the gameplay modules eagerly adds about 30 ms.
+IMPORT_OVERHEAD_BUDGET_MS = 20
+# About twice the measured 230-330 ms, most of which is pygame's own import.
+FIRST_FRAME_BUDGET_MS = 600
+RUNS = 3
+
+# Only needed once ENTER is pressed; none of these should be imported to draw the menu.
+# NumPy is not listed because pygame imports it itself (through pygame.surfarray).
+LAZY_MODULES = ('map', 'player', 'raycasting', 'object_renderer', 'enemy', 'weapon',
+                'sound', 'spawner', 'hitscan', 'projection', 'pipeline')
+
+FIRST_FRAME = """
+import sys, time
+start = time.perf_counter()
+import main
+game = main.Game()
+game.draw_menu()
+elapsed = (time.perf_counter() - start) * 1000
+print(elapsed, ','.join(name for name in %r if name in sys.modules))
+""" % (LAZY_MODULES,)
+
+
+def run(args):
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy', PYGAME_HIDE_SUPPORT_PROMPT='1')
+    return subprocess.run([sys.executable] + args, capture_output=True, text=True, check=True,
+                          cwd=os.path.dirname(os.path.abspath(__file__)), env=env)
+
+
+def import_times_ms():
+    """Cumulative import times of main and of the pygame it pulls in, from one -X importtime report."""
+    report = run(['-X', 'importtime', '-c', 'import main']).stderr
+    cumulative = {}
+    for line in report.splitlines():
+        fields = [field.strip() for field in line.split('|')]
+        if len(fields) == 3 and fields[2] in ('main', 'pygame'):
+            cumulative[fields[2]] = int(fields[1]) / 1000
+    if len(cumulative) != 2:
+        raise RuntimeError('main or pygame missing from the importtime report')
+    return cumulative['main'], cumulative['pygame']
+
+
+def first_frame():
+    """Milliseconds to the first menu frame, and the gameplay modules loaded by then."""
+    elapsed, loaded = (run(['-c', FIRST_FRAME]).stdout.split() + [''])[:2]
+    return float(elapsed), [name for name in loaded.split(',') if name]
+
+
+def main():
+    import_ms, pygame_ms = min(import_times_ms() for _ in range(RUNS))
+    overhead_ms = import_ms - pygame_ms
+    frames = [first_frame() for _ in range(RUNS)]
+    frame_ms = min(elapsed for elapsed, _ in frames)
+    loaded = sorted(set(name for _, names in frames for name in names))
+
+    print(f'import main:  {import_ms:7.1f} ms ({pygame_ms:.1f} ms of it pygame)')
+    print(f'main overhead:{overhead_ms:7.1f} ms (budget {IMPORT_OVERHEAD_BUDGET_MS} ms)')
+    print(f'first frame:  {frame_ms:7.1f} ms (budget {FIRST_FRAME_BUDGET_MS} ms)')
+    print(f'eager loads:  {", ".join(loaded) or "none"}')
+    failed = overhead_ms > IMPORT_OVERHEAD_BUDGET_MS or frame_ms > FIRST_FRAME_BUDGET_MS or loaded
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""Display-free checks for the hit-scan helpers in hitscan.py.
+
+Covers target selection, wall blocking, broad-phase culling and damage falloff, and checks
+that a centred shotgun blast still kills in a few shots across the engagement range.
+Exits non-zero when a check fails:
+
+    python check_hitscan.py
+"""
+import math
+import os
+import sys
+import numpy as np
+from settings import *
+from hitscan import pellet_angles, resolve_hits, damage_falloff, shot_damage
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+from enemy import Enemy  # imports pygame, but reading class stats needs no display
+
+MAX_SHOTS_TO_KILL = 3  # anywhere in the 6-10 unit engagement range
+OPEN = np.full(NUM_RAYS, np.inf)
+
+
+def fire(targets, depth_buffer=OPEN, pellets=WEAPON_PELLETS, spread=WEAPON_SPREAD):
+    """Fires from the origin along +x and returns the hit index and distance of every pellet."""
+    angles = pellet_angles(0.0, pellets, spread)
+    return resolve_hits((0.0, 0.0), 0.0, angles, np.array(targets, dtype=float), depth_buffer, ENEMY_HIT_RADIUS)
+
+
+def weapon_damage(targets, depth_buffer=OPEN):
+    """Damage per target from a shot along +x at the origin, with the shotgun's settings (as Weapon.fire)."""
+    return shot_damage((0.0, 0.0, 0.0), targets, depth_buffer, ENEMY_HIT_RADIUS, WEAPON_PELLETS, WEAPON_SPREAD,
+                       WEAPON_PELLET_DAMAGE, WEAPON_FALLOFF_START, WEAPON_FALLOFF_END, WEAPON_FALLOFF_MIN)
+
+
+def shots_to_kill(distance):
+    damage = weapon_damage([(distance, 0.0)])[0]
+    return math.ceil(Enemy.max_health / damage) if damage else math.inf
+
+
+def check_nearest_target_wins():
+    hits, distances = fire([(8.0, 0.0), (4.0, 0.0), (6.0, 0.05)])
+    return (hits == 1).all() and np.allclose(distances, 4.0, atol=ENEMY_HIT_RADIUS)
+
+
+def check_target_behind_wall_is_missed():
+    hits, _ = fire([(6.0, 0.0)], depth_buffer=np.full(NUM_RAYS, 5.0))
+    return (hits == -1).all()
+
+
+def check_target_in_front_of_wall_is_hit():
+    hits, _ = fire([(4.0, 0.0)], depth_buffer=np.full(NUM_RAYS, 5.0))
+    return (hits == 0).all()
+
+
+def check_targets_outside_cone_are_skipped():
+    # to the side, behind the shooter, and past MAX_DEPTH
+    hits, _ = fire([(0.0, 3.0), (-5.0, 0.0), (MAX_DEPTH + 1.0, 0.0)])
+    return (hits == -1).all()
+
+
+def check_falloff_edges():
+    start, end, minimum = WEAPON_FALLOFF_START, WEAPON_FALLOFF_END, WEAPON_FALLOFF_MIN
+    falloff = damage_falloff([0.0, start, (start + end) / 2, end, end * 2], start, end, minimum)
+    return np.allclose(falloff, [1.0, 1.0, (1 + minimum) / 2, minimum, minimum])
+
+
+def check_shot_damage_sums_pellets_per_target():
+    # one target taking every pellet at point blank, one behind it taking none
+    damage = weapon_damage([(1.0, 0.0), (2.0, 0.0)])
+    return np.allclose(damage, [WEAPON_PELLETS * WEAPON_PELLET_DAMAGE, 0.0])
+
+
+def check_shot_damage_blocked_by_wall():
+    return weapon_damage([(6.0, 0.0)], depth_buffer=np.full(NUM_RAYS, 5.0)) == [0.0]
+
+
+def check_fan_spreads_with_range():
+    # a real spread lands fewer pellets on a distant target than on a close one
+    close, _ = fire([(3.0, 0.0)])
+    far, _ = fire([(12.0, 0.0)])
+    return (far == 0).sum() < (close == 0).sum()
+
+
+def check_falloff_ends_within_range():
+    return WEAPON_FALLOFF_END <= MAX_DEPTH
+
+
+def check_single_pellet_fires_straight():
+    return np.allclose(pellet_angles(0.3, 1, 0.5), [0.3])
+
+
+def check_engagement_range_shots_to_kill():
+    return all(shots_to_kill(distance) <= MAX_SHOTS_TO_KILL for distance in (3, 6, 8, 10))
+
+
+def main():
+    checks = [value for name, value in globals().items() if name.startswith('check_')]
+    failed = 0
+    for check in checks:
+        ok = bool(check())
+        failed += not ok
+        print(f'{"ok  " if ok else "FAIL"} {check.__name__[len("check_"):]}')
+    print('shots to kill: ' + '  '.join(f'{d}: {shots_to_kill(d)}' for d in (3, 6, 8, 10, 12, 15, 18)))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
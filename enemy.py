@@ -3,36 +3,56 @@ import math
 import os
 import heapq
 import random
+from projection import normalize_angle
 
 class Enemy:
     """Enemy logic, movement, shooting, and animation."""
+    __slots__ = ('game', 'x', 'y', 'health', 'current_frame', 'last_anim_time', 'path', 'last_shot_time',
+                 'muzzle_flash_timer', 'muzzle_flash_active', 'current_image')
+
+    # Per-type data, shared by every enemy instead of copied into each one
+    max_health = 50
+    speed = 0.002
+    animation_time = 120
+    gun_accuracy = 0.5 # ideal % of shots that will hit the player for damage
+    shoot_cooldown = 1000
+    damage = 5
+    muzzle_flash_time = 150
+    walk_frames = None
+    image_idle = None
+    image_shoot = None
+    shot_sound = None
+
     def __init__(self, game, x, y):
         self.game = game
-        self.x = x
-        self.y = y
-        self.max_health = 50
-        self.health = 50
-        self.speed = 0.002
-        self.walk_frames = []
+        if Enemy.walk_frames is None:
+            Enemy.load_assets()
+        self.reset(x, y)
+
+    @classmethod
+    def load_assets(cls):
+        """Load the images and sounds shared by all enemies (needs an initialized display)."""
+        cls.walk_frames = []
         walk_folder = 'resources/textures/enemy_walk'
         for fname in sorted(os.listdir(walk_folder)):
             if fname.endswith('.png'):
                 img = pg.image.load(os.path.join(walk_folder, fname)).convert_alpha()
-                self.walk_frames.append(img)
+                cls.walk_frames.append(img)
+        cls.shot_sound = pg.mixer.Sound('resources/sound/shotgun.wav')
+        cls.image_idle = pg.image.load('resources/sprites/enemy_idle.png').convert_alpha()
+        cls.image_shoot = pg.image.load('resources/sprites/enemy_shoot.png').convert_alpha()
+
+    def reset(self, x, y):
+        """Put the enemy back into its freshly spawned state at (x, y)."""
+        self.x = x
+        self.y = y
+        self.health = self.max_health
         self.current_frame = 0
-        self.animation_time = 120
         self.last_anim_time = pg.time.get_ticks()
         self.path = []
-        self.gun_accuracy = 0.5 # ideal % of shots that will hit the player for damage
-        self.shoot_cooldown = 1000
         self.last_shot_time = 0
-        self.damage = 5
-        self.shot_sound = pg.mixer.Sound('resources/sound/shotgun.wav')
-        self.muzzle_flash_time = 150
         self.muzzle_flash_timer = 0
         self.muzzle_flash_active = False
-        self.image_idle = pg.image.load('resources/sprites/enemy_idle.png').convert_alpha()
-        self.image_shoot = pg.image.load('resources/sprites/enemy_shoot.png').convert_alpha()
         self.current_image = self.image_idle
 
     @property
@@ -121,8 +141,7 @@ class Enemy:
             distance = math.hypot(dx, dy)
             angle_to_player = math.atan2(dy, dx)
             enemy_facing_angle = angle_to_player + random.uniform(-0.3, 0.3)
-            player_angle = math.atan2(self.game.player.y - self.y, self.game.player.x - self.x)
-            angle_diff = abs((enemy_facing_angle - player_angle + math.pi) % (2 * math.pi) - math.pi)
+            angle_diff = abs(normalize_angle(enemy_facing_angle - angle_to_player))
             if angle_diff < 0.2 and distance < 10 and self.has_line_of_sight():
                 self.shot_sound.play()
                 self.muzzle_flash_active = True
@@ -143,31 +162,27 @@ class Enemy:
 
     def has_line_of_sight(self):
         """Check if there is a clear path to the player (no walls in between)."""
-        x0, y0 = int(self.x), int(self.y)
-        x1, y1 = int(self.game.player.x), int(self.game.player.y)
-        dx = abs(x1 - x0)
-        dy = abs(y1 - y0)
-        x, y = x0, y0
-        sx = 1 if x0 < x1 else -1
-        sy = 1 if y0 < y1 else -1
-        if dx > dy:
-            err = dx / 2.0
-            while x != x1:
-                if (x, y) in self.game.map.world_map and (x, y) != (x0, y0) and (x, y) != (x1, y1):
-                    return False
-                err -= dy
-                if err < 0:
-                    y += sy
-                    err += dx
-                x += sx
-        else:
-            err = dy / 2.0
-            while y != y1:
-                if (x, y) in self.game.map.world_map and (x, y) != (x0, y0) and (x, y) != (x1, y1):
-                    return False
-                err -= dx
-                if err < 0:
-                    x += sx
-                    err += dy
-                y += sy
-        return True
\ No newline at end of file
+        return self.game.map.line_of_sight(self.map_pos, self.game.player.map_pos)
+
+    @property
+    def map_pos(self):
+        return int(self.x), int(self.y)
+
+
+class EnemyPool:
+    """Recycles dead enemies into later waves instead of building new ones."""
+    def __init__(self, game):
+        self.game = game
+        self.free = []
+
+    def acquire(self, x, y):
+        """Return a reset enemy at (x, y), reusing a released one when available."""
+        if self.free:
+            enemy = self.free.pop()
+            enemy.reset(x, y)
+            return enemy
+        return Enemy(self.game, x, y)
+
+    def release(self, enemy):
+        """Hand an enemy that is no longer in play back to the pool."""
+        self.free.append(enemy)
\ No newline at end of file
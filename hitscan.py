@@ -0,0 +1,78 @@
+import numpy as np
+from settings import *
+from projection import normalize_angle
+
+
+def pellet_angles(angle, pellets, spread):
+    """Fans `pellets` ray angles evenly across `spread` radians centered on the aim angle."""
+    if pellets == 1:
+        return np.array([angle])
+    return angle + np.linspace(-spread / 2, spread / 2, pellets)
+
+
+def resolve_hits(origin, view_angle, angles, targets, depth_buffer, radius, max_range=MAX_DEPTH):
+    """Resolves every pellet against the targets near its cone in one vectorized pass.
+
+    origin is the shooter (x, y), angles the absolute pellet angles, targets an (N, 2) array
+    of positions treated as circles of `radius`, and depth_buffer the per-ray perpendicular
+    wall depths of the current frame. Returns the index of the first target each pellet hits
+    (-1 for a miss) and the distance to it (inf for a miss).
+    """
+    angles = np.asarray(angles, dtype=float)
+    hits = np.full(len(angles), -1)
+    distances = np.full(len(angles), np.inf)
+    if not len(targets):
+        return hits, distances
+
+    # broad phase: only targets in range whose circle overlaps the pellet cone
+    rel = np.asarray(targets, dtype=float) - origin
+    target_dist = np.hypot(rel[:, 0], rel[:, 1])
+    bearing = normalize_angle(np.arctan2(rel[:, 1], rel[:, 0]) - view_angle)
+    half_width = np.arcsin(np.clip(radius / np.maximum(target_dist, radius), 0, 1))
+    pellet_rel = normalize_angle(angles - view_angle)
+    near = np.flatnonzero((target_dist < max_range)
+                          & (bearing + half_width >= pellet_rel.min())
+                          & (bearing - half_width <= pellet_rel.max()))
+    if not len(near):
+        return hits, distances
+
+    # narrow phase: pellets x nearby targets, ray against circle
+    dir_x, dir_y = np.cos(angles)[:, None], np.sin(angles)[:, None]
+    along = dir_x * rel[near, 0] + dir_y * rel[near, 1]
+    across = np.abs(dir_x * rel[near, 1] - dir_y * rel[near, 0])
+
+    # walls: the depth buffer is perpendicular depth, so convert it to distance along each pellet
+    ray = ((pellet_rel + HALF_FOV) / FOV * len(depth_buffer)).astype(int)
+    in_view = (ray >= 0) & (ray < len(depth_buffer))
+    wall_dist = np.full(len(angles), np.inf)
+    wall_dist[in_view] = depth_buffer[ray[in_view]] / np.cos(pellet_rel[in_view])
+
+    blocked = (along <= 0) | (across > radius) | (along >= wall_dist[:, None])
+    along = np.where(blocked, np.inf, along)
+    first = along.argmin(axis=1)
+    first_dist = along[np.arange(len(angles)), first]
+    hit = np.isfinite(first_dist)
+    hits[hit] = near[first[hit]]
+    distances[hit] = first_dist[hit]
+    return hits, distances
+
+
+def damage_falloff(distances, start, end, minimum):
+    """Damage multiplier per distance: 1 up to `start`, easing linearly down to `minimum` at `end`."""
+    fraction = (np.asarray(distances, dtype=float) - start) / (end - start)
+    return np.clip(1 - fraction * (1 - minimum), minimum, 1)
+
+
+def shot_damage(pose, targets, depth_buffer, radius, pellets, spread, damage,
+                falloff_start, falloff_end, falloff_min):
+    """Fires `pellets` pellets from pose (x, y, angle) and returns the total damage dealt to each target.
+
+    Each pellet that lands deals `damage` scaled by damage_falloff at its hit distance.
+    """
+    x, y, angle = pose
+    angles = pellet_angles(angle, pellets, spread)
+    hits, distances = resolve_hits((x, y), angle, angles, np.array(targets, dtype=float).reshape(-1, 2),
+                                   depth_buffer, radius)
+    landed = hits >= 0
+    weights = damage * damage_falloff(distances[landed], falloff_start, falloff_end, falloff_min)
+    return np.bincount(hits[landed], weights=weights, minlength=len(targets)).tolist()
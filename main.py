@@ -1,17 +1,9 @@
 import pygame as pg
 import sys
-from settings import *
-from map import *
-from player import *
-from raycasting import *
-from object_renderer import *
-from enemy import Enemy
-from weapon import Weapon
-from sound import *
-import math
-import random
-
-pg.mixer.init()
+from settings import RES, FPS, PLAYER_MAX_HEALTH
+
+# Gameplay modules (and NumPy with them) are imported in new_game, so the menu can be
+# shown, and this module imported by tools, without loading any of them.
 
 class Game:
     """Main game class handling state, updates, and rendering."""
@@ -22,16 +14,30 @@ class Game:
         self.clock = pg.time.Clock()
         self.delta_time = 1
         self.state = "menu"
-        self.new_game()
-    
+        self.started = False
+        self.fonts = {}
+
     def new_game(self):
         """Initialize or reset all game objects and state."""
+        from map import Map
+        from player import Player
+        from object_renderer import ObjectRenderer
+        from raycasting import RayCasting
+        from weapon import Weapon
+        from sound import Sound
+        from spawner import Spawner
+        from enemy import EnemyPool
+
+        self.started = True
         self.map = Map(self)
         self.player = Player(self)
         self.object_renderer = ObjectRenderer(self)
         self.raycasting = RayCasting(self)
         self.weapon = Weapon(self)
         self.sound = Sound(self)
+        self.spawner = Spawner(self)
+        self.enemy_pool = EnemyPool(self)
+        self.enemies = []
         pg.mixer.music.play(-1)
         self.wave = 1
         self.spawn_wave()
@@ -53,7 +59,7 @@ class Game:
                 self.player.shot = False
             for enemy in self.enemies:
                 enemy.update()
-            self.enemies = [enemy for enemy in self.enemies if enemy.health > 0]
+            self.remove_dead_enemies()
             self.enemies_remaining = len(self.enemies)
             if self.enemies_remaining == 0:
                 self.intermission("Next Wave!")
@@ -66,40 +72,13 @@ class Game:
 
     def handle_shot(self):
         """Handle logic for when the player fires their weapon."""
-        min_angle = 0.2
-        min_distance = float('inf')
-        target_enemy = None
-        px, py = self.player.x, self.player.y
-        pa = self.player.angle
-        num_rays = getattr(self.raycasting, "num_rays", self.screen.get_width())
-        ray_casting_result = getattr(self.raycasting, "ray_casting_result", [])
-
-        for enemy in self.enemies:
-            dx = enemy.x - px
-            dy = enemy.y - py
-            distance = (dx ** 2 + dy ** 2) ** 0.5
-            angle = abs((math.atan2(dy, dx) - pa + math.pi) % (2 * math.pi) - math.pi)
-            if angle < min_angle and distance < min_distance and enemy.health > 0:
-                half_fov = math.pi / 6
-                if ray_casting_result and num_rays:
-                    rel_angle = math.atan2(dy, dx) - pa
-                    while rel_angle > math.pi:
-                        rel_angle -= 2 * math.pi
-                    while rel_angle < -math.pi:
-                        rel_angle += 2 * math.pi
-                    ray_index = int((rel_angle + half_fov) / (2 * half_fov) * num_rays)
-                    ray_index = max(0, min(ray_index, num_rays - 1))
-                    if 0 <= ray_index < len(ray_casting_result):
-                        wall_dist = ray_casting_result[ray_index][0]
-                        if distance < wall_dist:
-                            min_distance = distance
-                            target_enemy = enemy
-                else:
-                    min_distance = distance
-                    target_enemy = enemy
-
-        if target_enemy:
-            target_enemy.take_damage(self.weapon.damage)
+        alive = [enemy for enemy in self.enemies if enemy.health > 0]
+        if alive:
+            damage = self.weapon.fire(self.raycasting.pose, [enemy.pos for enemy in alive],
+                                      self.raycasting.depth_buffer)
+            for enemy, amount in zip(alive, damage):
+                if amount:
+                    enemy.take_damage(amount)
         self.player.shot = False
 
     def draw(self): 
@@ -115,7 +94,7 @@ class Game:
             pg.draw.rect(self.screen, (60, 60, 60), (20, 20, bar_width, bar_height))
             pg.draw.rect(self.screen, (200, 0, 0), (20, 20, int(bar_width * health_ratio), bar_height))
             # Draw wave and enemies remaining
-            font = pg.font.SysFont('Arial', 30)
+            font = self.get_font(30)
             wave_text = font.render(f"Wave: {self.wave}", True, (255, 255, 255))
             enemies_text = font.render(f"Enemies: {self.enemies_remaining}", True, (255, 255, 255))
             self.screen.blit(wave_text, (20, 50))
@@ -126,9 +105,9 @@ class Game:
     def draw_menu(self):
         """Draw the main menu screen."""
         self.screen.fill((0, 0, 0))
-        font = pg.font.SysFont('Arial', 80)
+        font = self.get_font(80)
         title = font.render("Doom: Lion's Arena", True, (255, 255, 0))
-        start_font = pg.font.SysFont('Arial', 50)
+        start_font = self.get_font(50)
         start = start_font.render("Press ENTER to Start", True, (255, 255, 255))
         quit_ = start_font.render("Press Q to Quit", True, (255, 255, 255))
         self.screen.blit(title, (self.screen.get_width() // 2 - title.get_width() // 2, 200))
@@ -136,6 +115,18 @@ class Game:
         self.screen.blit(quit_, (self.screen.get_width() // 2 - quit_.get_width() // 2, 500))
         pg.display.flip()
 
+    def get_font(self, size):
+        """Return the Arial font at the given size, loading it only the first time."""
+        if size not in self.fonts:
+            self.fonts[size] = pg.font.SysFont('Arial', size)
+        return self.fonts[size]
+
+    def start_game(self):
+        """Leave the menu, building the gameplay subsystems the first time."""
+        if not self.started:
+            self.new_game()
+        self.state = "game"
+
     def check_events(self):
         """Handle all user input and system events."""
         for event in pg.event.get():
@@ -145,7 +136,7 @@ class Game:
             if event.type == pg.KEYDOWN:
                 if self.state == "menu":
                     if event.key == pg.K_RETURN:
-                        self.state = "game"
+                        self.start_game()
                     elif event.key == pg.K_q:
                         pg.quit()
                         sys.exit()
@@ -161,25 +152,24 @@ class Game:
 
     def spawn_wave(self):
         """Spawn a new wave of enemies and reset player health."""
-        self.enemies = []
-        map_rows = self.map.rows
-        map_cols = self.map.cols
-        possible_spawns = []
-        for y in range(map_rows // 2, map_rows - 2):
-            for x in range(map_cols // 2, map_cols - 2):
-                if (x, y) not in self.map.world_map:
-                    possible_spawns.append((x + 0.5, y + 0.5))
-        random.shuffle(possible_spawns)
-        for i in range(self.wave * 2):
-            if possible_spawns:
-                x, y = possible_spawns.pop()
-                self.enemies.append(Enemy(self, x, y))
+        for enemy in self.enemies:
+            self.enemy_pool.release(enemy)
+        self.enemies = [self.enemy_pool.acquire(x, y) for x, y in self.spawner.sample(self.wave * 2)]
         self.enemies_remaining = len(self.enemies)
         self.player.health = PLAYER_MAX_HEALTH
 
+    def remove_dead_enemies(self):
+        """Swap dead enemies with the last one and pop them into the pool, without rebuilding the list."""
+        enemies = self.enemies
+        for i in range(len(enemies) - 1, -1, -1):
+            if enemies[i].health <= 0:
+                self.enemy_pool.release(enemies[i])
+                enemies[i] = enemies[-1]
+                enemies.pop()
+
     def intermission(self, message):
         """Display a message between waves or on game over."""
-        font = pg.font.SysFont('Arial', 60)
+        font = self.get_font(60)
         text = font.render(message, True, (255, 255, 0))
         rect = text.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2))
         self.screen.fill((0, 0, 0))
@@ -198,6 +188,7 @@ class Game:
                     sys.exit()
                 if event.type == pg.KEYDOWN:
                     if event.key == pg.K_RETURN:
+                        self.start_game()
                         self.menu_active = False
                     if event.key == pg.K_q:
                         pg.quit()
@@ -52,6 +52,37 @@ class Map:
                 if value:
                     self.world_map[(i, j)] = value
 
+    def line_of_sight(self, start, end):
+        """Check if no wall cell lies strictly between two map cells (Bresenham walk)."""
+        x0, y0 = start
+        x1, y1 = end
+        dx = abs(x1 - x0)
+        dy = abs(y1 - y0)
+        x, y = x0, y0
+        sx = 1 if x0 < x1 else -1
+        sy = 1 if y0 < y1 else -1
+        if dx > dy:
+            err = dx / 2.0
+            while x != x1:
+                if (x, y) in self.world_map and (x, y) != (x0, y0) and (x, y) != (x1, y1):
+                    return False
+                err -= dy
+                if err < 0:
+                    y += sy
+                    err += dx
+                x += sx
+        else:
+            err = dy / 2.0
+            while y != y1:
+                if (x, y) in self.world_map and (x, y) != (x0, y0) and (x, y) != (x1, y1):
+                    return False
+                err -= dx
+                if err < 0:
+                    x += sx
+                    err += dy
+                y += sy
+        return True
+
     def draw(self):
         """Draws the map on the screen (for debugging/minimap)."""
         [pg.draw.rect(self.game.screen, 'darkgray', (pos[0] * 100, pos[1] * 100, 100, 100), 2)
@@ -1,6 +1,8 @@
 import math
+import numpy as np
 import pygame as pg
 from settings import *
+from projection import normalize_angle, angle_to_screen_x
 
 class ObjectRenderer:
     """Handles drawing all objects (walls, enemies, player weapon) to the screen."""
@@ -11,6 +13,11 @@ class ObjectRenderer:
         self.sky_image = self.get_texture('resources/textures/sky.png', (WIDTH, HALF_HEIGHT))
         self.sky_offset = 0
         self.blood_screen = self.get_texture('resources/textures/blood_screen.png', (WIDTH, HEIGHT))
+        self.floor_surface = pg.Surface((WIDTH // FLOOR_RES_SCALE, HALF_HEIGHT // FLOOR_RES_SCALE))
+        self.floor_scaled = pg.Surface((WIDTH, HALF_HEIGHT))
+        self.floor_tables = {}
+        self.floor_texture = self.get_texture_pixels(FLOOR_TEXTURE) if FLOOR_TEXTURE else None
+        self.ceiling_texture = self.get_texture_pixels(CEILING_TEXTURE) if CEILING_TEXTURE else None
 
     def draw(self):
         self.draw_background()
@@ -21,10 +28,48 @@ class ObjectRenderer:
         self.screen.blit(self.blood_screen, (0,0))
     
     def draw_background(self):
-        self.sky_offset = (self.sky_offset + 4.5 * self.game.player.rel) % WIDTH
-        self.screen.blit(self.sky_image, (-self.sky_offset, 0))
-        self.screen.blit(self.sky_image, (-self.sky_offset + WIDTH, 0))
-        pg.draw.rect(self.screen, FLOOR_COLOR, (0, HALF_HEIGHT, WIDTH, HEIGHT))
+        if self.ceiling_texture is None:
+            self.sky_offset = (self.sky_offset + 4.5 * self.game.player.rel) % WIDTH
+            self.screen.blit(self.sky_image, (-self.sky_offset, 0))
+            self.screen.blit(self.sky_image, (-self.sky_offset + WIDTH, 0))
+        if self.floor_texture is None:
+            pg.draw.rect(self.screen, FLOOR_COLOR, (0, HALF_HEIGHT, WIDTH, HEIGHT))
+        if self.floor_texture is not None or self.ceiling_texture is not None:
+            self.draw_floor()
+
+    def get_floor_tables(self, size):
+        """Per-resolution tables of row depth and row depth * column tangent, in surfarray (x, y) order."""
+        if size not in self.floor_tables:
+            width, height = size
+            scale_x, scale_y = WIDTH / width, HALF_HEIGHT / height
+            # column angles match the raycaster: rays are spread linearly across the FOV
+            column_angle = ((np.arange(width) + 0.5) * scale_x / WIDTH) * FOV - HALF_FOV
+            # a floor row p pixels below the horizon is where a wall at depth SCREEN_DIST / 2p ends
+            row_depth = SCREEN_DIST / (2 * (np.arange(height) + 0.5) * scale_y)
+            depth = np.broadcast_to(row_depth[None, :], size)
+            depth_tan = np.tan(column_angle)[:, None] * row_depth[None, :]
+            self.floor_tables[size] = depth, depth_tan
+        return self.floor_tables[size]
+
+    def draw_floor(self):
+        """Casts the textured floor (and ceiling, if set) in one vectorized pass at reduced resolution."""
+        x, y, angle = self.game.raycasting.pose
+        depth, depth_tan = self.get_floor_tables(self.floor_surface.get_size())
+        sin_a, cos_a = math.sin(angle), math.cos(angle)
+        floor_x = depth * cos_a - depth_tan * sin_a + x
+        floor_y = depth * sin_a + depth_tan * cos_a + y
+        tex_x = (floor_x * TEXTURE_SIZE).astype(np.intp) & (TEXTURE_SIZE - 1)
+        tex_y = (floor_y * TEXTURE_SIZE).astype(np.intp) & (TEXTURE_SIZE - 1)
+        index = tex_x * TEXTURE_SIZE + tex_y
+
+        if self.floor_texture is not None:
+            pg.surfarray.blit_array(self.floor_surface, self.floor_texture[index])
+            pg.transform.scale(self.floor_surface, (WIDTH, HALF_HEIGHT), self.floor_scaled)
+            self.screen.blit(self.floor_scaled, (0, HALF_HEIGHT))
+        if self.ceiling_texture is not None:
+            pg.surfarray.blit_array(self.floor_surface, self.ceiling_texture[index])
+            pg.transform.scale(self.floor_surface, (WIDTH, HALF_HEIGHT), self.floor_scaled)
+            self.screen.blit(pg.transform.flip(self.floor_scaled, False, True), (0, 0))
 
     def render_game_objects(self):
         list_objects = self.game.raycasting.objects_to_render
@@ -32,59 +77,70 @@ class ObjectRenderer:
             self.screen.blit(image, pos)
 
     def draw_enemies(self):
-        player = self.game.player
-        half_fov = math.pi / 6
-        num_rays = getattr(self.game.raycasting, "num_rays", WIDTH)
-        ray_casting_result = getattr(self.game.raycasting, "ray_casting_result", [])
+        """Draws enemy sprites back to front, clipped column by column against the wall depth buffer."""
+        x, y, view_angle = self.game.raycasting.pose
+        depth_buffer = self.game.raycasting.depth_buffer
 
-        enemies = sorted(self.game.enemies, key=lambda e: -((e.x - player.x) ** 2 + (e.y - player.y) ** 2))
+        enemies = sorted(self.game.enemies, key=lambda e: -((e.x - x) ** 2 + (e.y - y) ** 2))
         for enemy in enemies:
-            dx = enemy.x - player.x
-            dy = enemy.y - player.y
+            dx = enemy.x - x
+            dy = enemy.y - y
             distance = math.hypot(dx, dy)
-            angle = math.atan2(dy, dx) - player.angle
-
-            while angle > math.pi:
-                angle -= 2 * math.pi
-            while angle < -math.pi:
-                angle += 2 * math.pi
-
-            if -half_fov < angle < half_fov:
-                proj_height = min(self.game.screen.get_height(),
-                                  int(HEIGHT / (distance * math.cos(angle) + 0.0001) * 1.8))
-                sprite = pg.transform.scale(enemy.current_image, (proj_height, proj_height))
-                screen_x = self.game.screen.get_width() // 2 + int(math.tan(angle) * self.game.screen.get_width() // 2) - proj_height // 2
-                screen_y = HALF_HEIGHT + proj_height // 2 - proj_height
-
-                # --- OCCLUSION CHECK ---
-                if ray_casting_result and num_rays:
-                    ray_index = int((angle + half_fov) / (2 * half_fov) * num_rays)
-                    ray_index = max(0, min(ray_index, num_rays - 1))
-                    if 0 <= ray_index < len(ray_casting_result):
-                        wall_dist = ray_casting_result[ray_index][0]
-                        if distance < wall_dist:
-                            self.game.screen.blit(sprite, (screen_x, screen_y))
-                else:
-                    self.game.screen.blit(sprite, (screen_x, screen_y))
-
-                
-                # Draw enemy health bar above the sprite
-                # Removed since bar shows through walls
-                """
-                bar_width = proj_height
-                bar_height = 7
-                health_ratio = enemy.health / enemy.max_health
-                bar_x = screen_x
-                bar_y = screen_y - bar_height - 4
-                pg.draw.rect(self.game.screen, (60, 60, 60), (bar_x, bar_y, bar_width, bar_height))
-                pg.draw.rect(self.game.screen, (0, 200, 0), (bar_x, bar_y, int(bar_width * health_ratio), bar_height))
-                """
+            angle = normalize_angle(math.atan2(dy, dx) - view_angle)
+
+            # perpendicular depth, comparable with the fishbowl corrected wall depths
+            depth = distance * math.cos(angle)
+            if depth <= 0:
+                continue
+            proj_height = min(HEIGHT, int(HEIGHT / (depth + 0.0001) * 1.8))
+            screen_x = int(angle_to_screen_x(angle)) - proj_height // 2
+            screen_y = HALF_HEIGHT - proj_height // 2
+
+            # frustum cull on the sprite's full width, not just its center
+            if screen_x + proj_height <= 0 or screen_x >= WIDTH:
+                continue
+
+            first_ray = max(0, screen_x // SCALE)
+            last_ray = min(NUM_RAYS, -(-(screen_x + proj_height) // SCALE))
+            visible = depth_buffer[first_ray:last_ray] > depth
+            if not visible.any():
+                continue
+
+            sprite = pg.transform.scale(enemy.current_image, (proj_height, proj_height))
+            for start, end in self.visible_spans(visible):
+                span_left = max(screen_x, (first_ray + start) * SCALE)
+                span_right = min(screen_x + proj_height, (first_ray + end) * SCALE)
+                self.screen.blit(sprite, (span_left, screen_y),
+                                 (span_left - screen_x, 0, span_right - span_left, proj_height))
+
+            # Draw enemy health bar above the sprite
+            # Removed since bar shows through walls
+            """
+            bar_width = proj_height
+            bar_height = 7
+            health_ratio = enemy.health / enemy.max_health
+            bar_x = screen_x
+            bar_y = screen_y - bar_height - 4
+            pg.draw.rect(self.game.screen, (60, 60, 60), (bar_x, bar_y, bar_width, bar_height))
+            pg.draw.rect(self.game.screen, (0, 200, 0), (bar_x, bar_y, int(bar_width * health_ratio), bar_height))
+            """
+
+    @staticmethod
+    def visible_spans(visible):
+        """Returns (start, end) index pairs of the runs of True in a boolean column mask."""
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], visible.view(np.int8), [0]))))
+        return edges.reshape(-1, 2)
 
     @staticmethod
     def get_texture(path, res=(TEXTURE_SIZE, TEXTURE_SIZE)):
         texture = pg.image.load(path).convert_alpha()
         return pg.transform.scale(texture, res)
     
+    def get_texture_pixels(self, path):
+        """Loads a texture as a flat array of pixels mapped to the floor surface format, indexed x * size + y."""
+        texture = self.get_texture(path).convert(self.floor_surface)
+        return pg.surfarray.array2d(texture).ravel()
+
     def load_wall_texures(self):
         return {
             1: self.get_texture('resources/textures/1.png'),
@@ -0,0 +1,76 @@
+import atexit
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import numpy as np
+from settings import *
+from raycasting import cast_rays
+
+
+def ray_cast_worker(conn, shm_name, slots, world_map):
+    """Worker process loop: casts each requested frame into its slot of the shared ray buffers."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    buffers = np.ndarray((slots, 4, NUM_RAYS), dtype=np.float64, buffer=shm.buf)
+    while True:
+        request = conn.recv()
+        if request is None:
+            break
+        slot, x, y, angle = request
+        cast_rays(x, y, angle, world_map, buffers[slot])
+        conn.send(slot)
+    del buffers
+    shm.close()
+
+
+class RayCastPipeline:
+    """Casts rays in a worker process so frame N+1 is computed while frame N is composited.
+
+    Results are handed back through a ring of shared memory buffers, `latency` frames behind
+    the player state they were submitted with. A latency of 0 waits for every frame.
+    """
+    def __init__(self, world_map, latency=PIPELINE_LATENCY):
+        self.latency = latency
+        self.slots = latency + 1
+        self.shm = shared_memory.SharedMemory(create=True, size=self.slots * 4 * NUM_RAYS * 8)
+        self.buffers = np.ndarray((self.slots, 4, NUM_RAYS), dtype=np.float64, buffer=self.shm.buf)
+        self.conn, child_conn = mp.Pipe()
+        self.process = mp.Process(target=ray_cast_worker, daemon=True,
+                                  args=(child_conn, self.shm.name, self.slots, world_map))
+        self.process.start()
+        self.poses = [None] * self.slots
+        self.frame = 0
+        self.in_flight = 0
+        self.closed = False
+        atexit.register(self.close)
+
+    def submit(self, x, y, angle):
+        """Queues a frame for the player state it should be cast from."""
+        slot = self.frame % self.slots
+        self.poses[slot] = x, y, angle
+        self.conn.send((slot, x, y, angle))
+        self.frame += 1
+        self.in_flight += 1
+
+    def collect(self):
+        """Returns the oldest frame's (ray buffer, (x, y, angle) it was cast from) once more than
+        `latency` frames are in flight, else None.
+
+        The buffer is reused `latency` + 1 submits later, so callers copy what they need out of it.
+        Raises EOFError if the worker has died.
+        """
+        if self.in_flight <= self.latency:
+            return None
+        slot = self.conn.recv()
+        self.in_flight -= 1
+        return self.buffers[slot], self.poses[slot]
+
+    def close(self):
+        """Stops the worker and releases the shared memory block."""
+        if self.closed:
+            return
+        self.closed = True
+        if self.process.is_alive():
+            self.conn.send(None)
+            self.process.join(timeout=1)
+        del self.buffers
+        self.shm.close()
+        self.shm.unlink()
@@ -0,0 +1,43 @@
+import math
+from collections import namedtuple
+from functools import lru_cache
+import numpy as np
+from settings import *
+
+RayTables = namedtuple('RayTables', ['sin_offsets', 'cos_offsets'])
+
+
+@lru_cache(maxsize=None)
+def ray_tables(fov=FOV, num_rays=NUM_RAYS):
+    """Per-ray sin and cos of the angle offset from the view direction.
+
+    Cached per FOV and ray count, so the tables are only rebuilt when either changes.
+    """
+    offsets = np.arange(num_rays) * (fov / num_rays) - fov / 2 + 0.0001
+    return RayTables(np.sin(offsets), np.cos(offsets))
+
+
+@lru_cache(maxsize=None)
+def fishbowl_factors(fov=FOV, num_rays=NUM_RAYS):
+    """Per-ray factors turning euclidean ray depth into perpendicular depth, as a list for the ray loop."""
+    return ray_tables(fov, num_rays).cos_offsets.tolist()
+
+
+def ray_directions(angle, fov=FOV, num_rays=NUM_RAYS):
+    """Sin and cos of every ray angle for a view angle, from the offset tables and one sin/cos pair."""
+    sin_offsets, cos_offsets = ray_tables(fov, num_rays)
+    sin_p, cos_p = math.sin(angle), math.cos(angle)
+    sin_rays = sin_p * cos_offsets + cos_p * sin_offsets
+    cos_rays = cos_p * cos_offsets - sin_p * sin_offsets
+    return sin_rays.tolist(), cos_rays.tolist()
+
+
+def normalize_angle(angle):
+    """Wraps an angle into [-pi, pi)."""
+    return (angle + math.pi) % math.tau - math.pi
+
+
+def angle_to_screen_x(angle, fov=FOV, width=WIDTH):
+    """Screen x of a view-relative angle; rays are spread linearly across the FOV."""
+    return (angle + fov / 2) / fov * width
+
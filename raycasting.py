@@ -1,6 +1,80 @@
 import pygame as pg
-import math
+import numpy as np
 from settings import *
+from projection import fishbowl_factors, ray_directions
+
+
+def cast_rays(ox, oy, angle, world_map, out):
+    """Casts NUM_RAYS rays from (ox, oy) and writes depth, proj_height, texture and offset rows into out.
+
+    Only touches its arguments, so it can run in a pipeline worker process as well as inline.
+    """
+    texture_vert, texture_hor = 1, 1
+    x_map, y_map = int(ox), int(oy)
+
+    sin_rays, cos_rays = ray_directions(angle)
+    fishbowl = fishbowl_factors()
+    result = []
+    for ray in range(NUM_RAYS):
+        sin_a = sin_rays[ray]
+        cos_a = cos_rays[ray]
+
+        # horizontals
+        y_hor, dy = (y_map + 1, 1) if sin_a > 0 else (y_map - 1e-6, -1)
+
+        depth_hor = (y_hor - oy) / sin_a
+        x_hor = ox + depth_hor * cos_a
+
+        delta_depth = dy / sin_a
+        dx = delta_depth * cos_a
+
+        for i in range(MAX_DEPTH):
+            tile_hor = int(x_hor), int(y_hor)
+            if tile_hor in world_map:
+                texture_hor = world_map[tile_hor]
+                break
+            x_hor += dx
+            y_hor += dy
+            depth_hor += delta_depth
+
+        # verticals
+        x_vert, dx = (x_map + 1, 1) if cos_a > 0 else (x_map - 1e-6, -1)
+
+        depth_vert = (x_vert - ox) / cos_a
+        y_vert = oy + depth_vert * sin_a
+
+        delta_depth = dx / cos_a
+        dy = delta_depth * sin_a
+
+        for i in range(MAX_DEPTH):
+            tile_vert = int(x_vert), int(y_vert)
+            if tile_vert in world_map:
+                texture_vert = world_map[tile_vert]
+                break
+            x_vert += dx
+            y_vert += dy
+            depth_vert += delta_depth
+
+        # depth, texture offset
+        if depth_vert < depth_hor:
+            depth, texture = depth_vert, texture_vert
+            y_vert %= 1
+            offset = y_vert if cos_a > 0 else (1 - y_vert)
+        else:
+            depth, texture = depth_hor, texture_hor
+            x_hor %= 1
+            offset = (1 - x_hor) if sin_a > 0 else x_hor
+
+        # remove fishbowl effect
+        depth *= fishbowl[ray]
+
+        # projection
+        proj_height = SCREEN_DIST / (depth + 0.0001)
+
+        # ray casting result
+        result.append((depth, proj_height, texture, offset))
+
+    out[:] = np.array(result).T
 
 
 class RayCasting:
@@ -10,8 +84,18 @@ class RayCasting:
         self.game = game
         self.num_rays = NUM_RAYS  # Make sure NUM_RAYS is defined in your settings
         self.ray_casting_result = []
+        self.depth_buffer = np.full(NUM_RAYS, np.inf)
+        self.rays = np.zeros((4, NUM_RAYS))
+        # Player (x, y, angle) the current rays were cast from. In pipelined mode this trails the
+        # player by PIPELINE_LATENCY frames; the floor, sprite clipping and shots project from it
+        # so they stay consistent with the walls and depth buffer.
+        self.pose = self.game.player.x, self.game.player.y, self.game.player.angle
         self.objects_to_render = []
         self.textures = self.game.object_renderer.wall_textures
+        self.pipeline = None
+        if PIPELINE:
+            from pipeline import RayCastPipeline
+            self.pipeline = RayCastPipeline(self.game.map.world_map)
 
     def get_objects_to_render(self):
         self.objects_to_render = []
@@ -36,73 +120,31 @@ class RayCasting:
             self.objects_to_render.append((depth, wall_column, wall_pos))
 
     def ray_cast(self):
-        self.ray_casting_result = []
-        texture_vert, texture_hor = 1, 1
-        ox, oy = self.game.player.pos
-        x_map, y_map = self.game.player.map_pos
-
-        ray_angle = self.game.player.angle - HALF_FOV + 0.0001
-        for ray in range(NUM_RAYS):
-            sin_a = math.sin(ray_angle)
-            cos_a = math.cos(ray_angle)
-
-            # horizontals
-            y_hor, dy = (y_map + 1, 1) if sin_a > 0 else (y_map - 1e-6, -1)
-
-            depth_hor = (y_hor - oy) / sin_a
-            x_hor = ox + depth_hor * cos_a
-
-            delta_depth = dy / sin_a
-            dx = delta_depth * cos_a
-
-            for i in range(MAX_DEPTH):
-                tile_hor = int(x_hor), int(y_hor)
-                if tile_hor in self.game.map.world_map:
-                    texture_hor = self.game.map.world_map[tile_hor]
-                    break
-                x_hor += dx
-                y_hor += dy
-                depth_hor += delta_depth
-
-            # verticals
-            x_vert, dx = (x_map + 1, 1) if cos_a > 0 else (x_map - 1e-6, -1)
-
-            depth_vert = (x_vert - ox) / cos_a
-            y_vert = oy + depth_vert * sin_a
-
-            delta_depth = dx / cos_a
-            dy = delta_depth * sin_a
-
-            for i in range(MAX_DEPTH):
-                tile_vert = int(x_vert), int(y_vert)
-                if tile_vert in self.game.map.world_map:
-                    texture_vert = self.game.map.world_map[tile_vert]
-                    break
-                x_vert += dx
-                y_vert += dy
-                depth_vert += delta_depth
-
-            # depth, texture offset
-            if depth_vert < depth_hor:
-                depth, texture = depth_vert, texture_vert
-                y_vert %= 1
-                offset = y_vert if cos_a > 0 else (1 - y_vert)
-            else:
-                depth, texture = depth_hor, texture_hor
-                x_hor %= 1
-                offset = (1 - x_hor) if sin_a > 0 else x_hor
-
-            # remove fishbowl effect
-            depth *= math.cos(self.game.player.angle - ray_angle)
-
-            # projection
-            proj_height = SCREEN_DIST / (depth + 0.0001)
+        player = self.game.player
+        cast_rays(player.x, player.y, player.angle, self.game.map.world_map, self.rays)
+        self.set_result(self.rays, (player.x, player.y, player.angle))
 
-            # ray casting result
-            self.ray_casting_result.append((depth, proj_height, texture, offset))
-
-            ray_angle += DELTA_ANGLE
+    def set_result(self, rays, pose):
+        """Copies a (4, NUM_RAYS) ray array into the depth buffer and the per-ray result tuples."""
+        self.pose = pose
+        self.depth_buffer[:] = rays[0]
+        self.ray_casting_result = list(zip(rays[0].tolist(), rays[1].tolist(),
+                                           rays[2].astype(int).tolist(), rays[3].tolist()))
 
     def update(self):
-        self.ray_cast()
-        self.get_objects_to_render()
\ No newline at end of file
+        if self.pipeline:
+            player = self.game.player
+            try:
+                self.pipeline.submit(player.x, player.y, player.angle)
+                result = self.pipeline.collect()
+            except (EOFError, OSError):
+                # the worker died; carry on casting inline
+                self.pipeline.close()
+                self.pipeline = None
+                self.ray_cast()
+            else:
+                if result is not None:
+                    self.set_result(*result)
+        else:
+            self.ray_cast()
+        self.get_objects_to_render()
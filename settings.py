@@ -31,4 +31,31 @@ SCREEN_DIST = HALF_WIDTH / math.tan(HALF_FOV)
 SCALE = WIDTH // NUM_RAYS
 
 TEXTURE_SIZE = 256
-HALF_TEXTURE_SIZE = TEXTURE_SIZE // 2
\ No newline at end of file
+HALF_TEXTURE_SIZE = TEXTURE_SIZE // 2
+
+SPAWN_MIN_DIST = 6
+SPAWN_FAR_DIST = 12
+SPAWN_SPACING = 2.5
+SPAWN_ATTEMPTS = 30
+
+FLOOR_TEXTURE = 'resources/textures/3.png'
+CEILING_TEXTURE = None
+FLOOR_RES_SCALE = 2
+
+# Pipelined mode casts rays in a worker process, PIPELINE_LATENCY frames behind the player.
+# Walls, floor, sprite clipping and shots all use the pose the rays were cast from, so occlusion
+# stays exact, but the view (and aim) trails mouse and movement input by that many frames.
+PIPELINE = False
+PIPELINE_LATENCY = 1
+
+# Shotgun: damage is per pellet. The fan is wider than an ENEMY_HIT_RADIUS target past about
+# 7 units, so fewer pellets land with range (6 up close, 4 at 8-10, 2 from 12 on), and falloff
+# runs over the range where hits resolve, reaching its minimum at MAX_DEPTH. A centred shot
+# still kills a 50 HP enemy in two out to 10 units.
+WEAPON_PELLETS = 6
+WEAPON_PELLET_DAMAGE = 8
+WEAPON_SPREAD = 0.1
+WEAPON_FALLOFF_START = 6
+WEAPON_FALLOFF_END = MAX_DEPTH
+WEAPON_FALLOFF_MIN = 0.5
+ENEMY_HIT_RADIUS = 0.35
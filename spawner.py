@@ -0,0 +1,74 @@
+import math
+import random
+from settings import *
+
+
+class Spawner:
+    """Picks enemy spawn points from a precomputed index of walkable cells."""
+    def __init__(self, game):
+        self.game = game
+        self.cells = self.get_walkable_cells()
+        self.visibility = {}
+
+    def get_walkable_cells(self):
+        """Builds the list of open cells enemies are allowed to spawn in."""
+        world_map = self.game.map.world_map
+        return [(x, y)
+                for y in range(1, self.game.map.rows - 1)
+                for x in range(1, self.game.map.cols - 1)
+                if (x, y) not in world_map]
+
+    @staticmethod
+    def band(cell, player_cell):
+        """Distance band of a cell from the player: 0 too close, 1 mid range, 2 far."""
+        distance = math.hypot(cell[0] - player_cell[0], cell[1] - player_cell[1])
+        if distance < SPAWN_MIN_DIST:
+            return 0
+        return 1 if distance < SPAWN_FAR_DIST else 2
+
+    def is_visible(self, cell, player_cell):
+        """Line of sight check between a cell and the player's cell, cached for the current sample."""
+        if cell not in self.visibility:
+            self.visibility[cell] = self.game.map.line_of_sight(cell, player_cell)
+        return self.visibility[cell]
+
+    @staticmethod
+    def is_spaced(cell, grid):
+        """Check that no accepted point lies within SPAWN_SPACING of the cell."""
+        gx, gy = int(cell[0] // SPAWN_SPACING), int(cell[1] // SPAWN_SPACING)
+        for i in range(gx - 1, gx + 2):
+            for j in range(gy - 1, gy + 2):
+                for other in grid.get((i, j), ()):
+                    if math.hypot(cell[0] - other[0], cell[1] - other[1]) < SPAWN_SPACING:
+                        return False
+        return True
+
+    def sample(self, count):
+        """Dart-throws up to count spread out spawn points, preferring far cells out of sight.
+
+        Each pass is bounded by SPAWN_ATTEMPTS tries per missing point, so the cost grows
+        with the number of enemies rather than with the size of the map.
+        """
+        player_cell = self.game.player.map_pos
+        # only valid for this player cell, so the cache never outgrows one map's worth of cells
+        self.visibility = {}
+        points = []
+        used = set()
+        grid = {}
+        # (minimum band, must be hidden, must respect spacing), strictest first
+        passes = ((2, True, True), (1, True, True), (1, False, True), (1, False, False))
+        for min_band, hidden, spaced in passes:
+            attempts = (count - len(points)) * SPAWN_ATTEMPTS
+            while len(points) < count and attempts > 0 and self.cells:
+                attempts -= 1
+                cell = random.choice(self.cells)
+                if cell in used or self.band(cell, player_cell) < min_band:
+                    continue
+                if hidden and self.is_visible(cell, player_cell):
+                    continue
+                if spaced and not self.is_spaced(cell, grid):
+                    continue
+                used.add(cell)
+                grid.setdefault((int(cell[0] // SPAWN_SPACING), int(cell[1] // SPAWN_SPACING)), []).append(cell)
+                points.append((cell[0] + 0.5, cell[1] + 0.5))
+        return points
@@ -2,6 +2,7 @@ import pygame as pg
 from collections import deque
 from settings import *
 from sound import *
+from hitscan import shot_damage
 
 class Weapon:
     """Handles weapon state, animation, and sound."""
@@ -20,7 +21,12 @@ class Weapon:
         self.frame_counter = 0
         self.idle_image = self.images[-1]
         self.image = self.idle_image
-        self.damage = 25
+        self.pellets = WEAPON_PELLETS
+        self.damage = WEAPON_PELLET_DAMAGE  # per pellet
+        self.spread = WEAPON_SPREAD  # radians across the whole pellet fan
+        self.falloff_start = WEAPON_FALLOFF_START
+        self.falloff_end = WEAPON_FALLOFF_END
+        self.falloff_min = WEAPON_FALLOFF_MIN
         self.animation_time = animation_time
         self.animation_time_prev = pg.time.get_ticks()
         self.animation_trigger = False
@@ -45,6 +51,11 @@ class Weapon:
                     self.frame_counter = 0
                     self.image = self.idle_image
 
+    def fire(self, pose, targets, depth_buffer):
+        """Fire every pellet from pose (x, y, angle) and return the total damage dealt to each target."""
+        return shot_damage(pose, targets, depth_buffer, ENEMY_HIT_RADIUS, self.pellets, self.spread,
+                           self.damage, self.falloff_start, self.falloff_end, self.falloff_min)
+
     def draw(self):
         """Draw the weapon on the screen."""
         self.game.screen.blit(self.image, self.weapon_pos)